@@ -1,17 +1,26 @@
 """
 CoinDCX Futures Trading Module
 Supports INR wallet balance (INR as collateral)
+Requires Python 3.11+
 """
 
+import sys
+
+if sys.version_info < (3, 11):
+    raise ImportError("coindcx_futures requires Python 3.11+ (asyncio.TaskGroup, dataclass slots)")
+
 import hmac
 import hashlib
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import asyncio
+import concurrent.futures
+import copy
 import socketio
 import aiohttp
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -26,6 +35,27 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bound once so the hot path skips the attribute lookup on time
+_now_ns = time.time_ns
+
+# Compact JSON serializer returning bytes (orjson when installed, stdlib json otherwise)
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Default max pooled connections per host for the sync and async HTTP sessions
+DEFAULT_POOL_SIZE = 100
+
+# Batched submission: max requests per flush and how long to wait for more to coalesce (seconds)
+BATCH_MAX_SIZE = 32
+BATCH_FLUSH_INTERVAL = 0.002
+
+# How long near-static instrument data is served from memory (seconds)
+ACTIVE_INSTRUMENTS_TTL = 30
+INSTRUMENT_DETAILS_TTL = 60
+
 
 class OrderType(Enum):
     MARKET_ORDER = "market_order"
@@ -55,7 +85,11 @@ class TimeInForce(Enum):
     FILL_OR_KILL = "fill_or_kill"
 
 
-@dataclass
+# Enum member -> API string, so order building can map enums and plain strings with one lookup
+_ENUM_VAL = {e: e.value for e in (*OrderSide, *OrderType, *TimeInForce)}
+
+
+@dataclass(slots=True, frozen=True)
 class Order:
     id: str
     pair: str
@@ -70,7 +104,7 @@ class Order:
     fee_amount: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     id: str
     pair: str
@@ -85,13 +119,20 @@ class Position:
 class CoinDCXFutures:
     """Main CoinDCX Futures Trading Class"""
     
-    def __init__(self, api_key: str = None, secret_key: str = None):
+    def __init__(self,
+                 api_key: str = None,
+                 secret_key: str = None,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 sign_in_executor: bool = False):
         """
         Initialize CoinDCX Futures client
         
         Args:
             api_key: API key (if not provided, will load from .env)
             secret_key: Secret key (if not provided, will load from .env)
+            pool_size: Max pooled keep-alive connections for REST calls
+            sign_in_executor: Sign async requests on a worker thread instead of the event loop
+                (only worth it for large bodies; small ones sign faster than a thread hop)
         """
         self.api_key = api_key or os.getenv('COINDCX_API_KEY')
         self.secret_key = secret_key or os.getenv('COINDCX_API_SECRET')
@@ -99,32 +140,106 @@ class CoinDCXFutures:
         if not self.api_key or not self.secret_key:
             raise ValueError("API credentials not provided. Please set COINDCX_API_KEY and COINDCX_SECRET_KEY")
         
+        # HMAC state with the key already absorbed; copied per signature. hashlib.sha256 is
+        # OpenSSL's, which selects SHA-NI / ARMv8 SHA2 via its own CPUID check at load time
+        self._hmac_template = hmac.new(self.secret_key.encode('utf-8'), b'', hashlib.sha256)
+        
+        # Same state with the fixed prefix of a timestamp-only body absorbed
+        self._empty_template_state = self._hmac_template.copy()
+        self._empty_template_state.update(b'{"timestamp":')
+        
+        # WebSocket auth signs a constant body, so the join payload is computed once
+        self._authchan_sig = self._generate_signature(_dumps({"channel": "coindcx"}))
+        self._authchan_payload = {
+            'channelName': 'coindcx',
+            'authSignature': self._authchan_sig,
+            'apiKey': self.api_key
+        }
+        
+        # Static request headers; only the signature changes per request
+        self._headers_template = {
+            'Content-Type': 'application/json',
+            'X-AUTH-APIKEY': self.api_key,
+            'X-AUTH-SIGNATURE': ''
+        }
+        
         self.base_url = os.getenv('API_BASE_URL', 'https://api.coindcx.com')
         self.websocket_url = os.getenv('WEBSOCKET_URL', 'wss://stream.coindcx.com')
         
+        # Persistent HTTP session so REST calls reuse pooled keep-alive connections
+        self.pool_size = pool_size
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Async HTTP session (created lazily, must be opened inside a running event loop)
+        self._http = None
+        
+        # Thread pool for signing off the event loop (created lazily when enabled)
+        self.sign_in_executor = sign_in_executor
+        self._sign_pool = None
+        
+        # Submission queue and worker for batched async requests (created lazily)
+        self._sq = None
+        self._sq_worker = None
+        
         # WebSocket client (will be initialized when needed)
         self.sio = None
         self.ws_connected = False
         
-        # Store active subscriptions
+        # Store active subscriptions (callbacks are per event, see the on_* handlers)
         self.subscriptions = set()
         
+        # Instrument data cache: key -> (monotonic fetch time, response)
+        self._instr_cache: Dict[Optional[str], tuple] = {}
+        
+        # Per-endpoint signing templates: endpoint -> (serialized body prefix, HMAC state with it absorbed)
+        self._sig_templates: Dict[str, tuple] = {}
+        
+        # Event name -> callback, applied to the socket.io client on connect
+        self._handlers: Dict[str, Callable] = {}
+        
         logger.info("CoinDCX Futures client initialized")
     
-    def _generate_signature(self, body: dict) -> str:
-        """Generate HMAC SHA256 signature for API requests"""
-        secret_bytes = bytes(self.secret_key, encoding='utf-8')
-        json_body = json.dumps(body, separators=(',', ':'))
-        signature = hmac.new(secret_bytes, json_body.encode(), hashlib.sha256).hexdigest()
-        return signature
+    def _generate_signature(self, body_bytes: bytes) -> str:
+        """Generate HMAC SHA256 signature for an already-serialized request body"""
+        h = self._hmac_template.copy()
+        h.update(body_bytes)
+        return h.hexdigest()
+    
+    def _serialize_and_sign(self, endpoint: str, body: dict, timestamp: int) -> tuple:
+        """
+        Serialize body with a trailing timestamp field and sign it
+        
+        Returns (body_bytes, signature); the same bytes are signed and sent. When an
+        endpoint is called again with a body that serializes identically (e.g. polling
+        get_orders), the cached HMAC state is reused and only the timestamp is hashed.
+        """
+        suffix = str(timestamp).encode() + b'}'
+        
+        if not body:
+            # Timestamp-only body (e.g. cancel_all_orders): only the digits are hashed
+            h = self._empty_template_state.copy()
+            h.update(suffix)
+            return b'{"timestamp":' + suffix, h.hexdigest()
+        
+        # Compared as bytes, not dicts: {"x": True} == {"x": 1} but they serialize differently
+        prefix = _dumps(body)[:-1] + b',"timestamp":'
+        cached = self._sig_templates.get(endpoint)
+        if cached is None or cached[0] != prefix:
+            state = self._hmac_template.copy()
+            state.update(prefix)
+            cached = (prefix, state)
+            self._sig_templates[endpoint] = cached
+        
+        h = cached[1].copy()
+        h.update(suffix)
+        return prefix + suffix, h.hexdigest()
     
     def _get_headers(self, signature: str) -> dict:
         """Get headers for API requests"""
-        return {
-            'Content-Type': 'application/json',
-            'X-AUTH-APIKEY': self.api_key,
-            'X-AUTH-SIGNATURE': signature
-        }
+        return {**self._headers_template, 'X-AUTH-SIGNATURE': signature}
     
     def _make_request(self, method: str, endpoint: str, body: dict = None) -> dict:
         """Make HTTP request to CoinDCX API"""
@@ -133,19 +248,20 @@ class CoinDCXFutures:
         if body is None:
             body = {}
         
-        # Add timestamp to body
-        body['timestamp'] = int(round(time.time() * 1000))
+        # Timestamp is always serialized last so a cached body prefix can be reused
+        body.pop('timestamp', None)
+        timestamp = _now_ns() // 1_000_000
         
-        # Generate signature
-        signature = self._generate_signature(body)
+        # Serialize once and sign those bytes, then add timestamp to body
+        body_bytes, signature = self._serialize_and_sign(endpoint, body, timestamp)
+        body['timestamp'] = timestamp
         headers = self._get_headers(signature)
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers)
+                response = self._session.get(url, headers=headers)
             elif method == 'POST':
-                json_body = json.dumps(body, separators=(',', ':'))
-                response = requests.post(url, data=json_body, headers=headers)
+                response = self._session.post(url, data=body_bytes, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -156,19 +272,198 @@ class CoinDCXFutures:
             logger.error(f"API request failed: {e}")
             raise
     
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return self._http
+    
+    async def _amake_request(self, method: str, endpoint: str, body: dict = None) -> dict:
+        """Make HTTP request to CoinDCX API using the shared aiohttp session"""
+        url = f"{self.base_url}{endpoint}"
+        
+        if body is None:
+            body = {}
+        
+        # Timestamp is always serialized last so a cached body prefix can be reused
+        body.pop('timestamp', None)
+        timestamp = _now_ns() // 1_000_000
+        
+        # Serialize once and sign those bytes, then add timestamp to body
+        if self.sign_in_executor:
+            if self._sign_pool is None:
+                self._sign_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+            loop = asyncio.get_running_loop()
+            body_bytes, signature = await loop.run_in_executor(
+                self._sign_pool, self._serialize_and_sign, endpoint, body, timestamp
+            )
+        else:
+            body_bytes, signature = self._serialize_and_sign(endpoint, body, timestamp)
+        body['timestamp'] = timestamp
+        headers = self._get_headers(signature)
+        
+        http = self._get_http()
+        try:
+            if method == 'GET':
+                async with http.get(url, headers=headers) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            elif method == 'POST':
+                async with http.post(url, data=body_bytes, headers=headers) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        except aiohttp.ClientError as e:
+            logger.error(f"API request failed: {e}")
+            raise
+    
+    def close(self):
+        """Close the pooled HTTP session and signing thread pool"""
+        self._session.close()
+        if self._sign_pool is not None:
+            self._sign_pool.shutdown(wait=False)
+            self._sign_pool = None
+    
+    @staticmethod
+    def _fail_pending(batch: list):
+        """Fail every unresolved future in batch because the client is closing"""
+        for _, _, _, future in batch:
+            if not future.done():
+                future.set_exception(ConnectionError("Client closed before the request completed"))
+    
+    async def _send_batch(self, batch: list):
+        """Send one batch concurrently and resolve each caller's future"""
+        try:
+            results = await asyncio.gather(
+                *(self._amake_request(method, endpoint, body) for method, endpoint, body, _ in batch),
+                return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            self._fail_pending(batch)
+            raise
+        
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def _submit_worker(self):
+        """Drain queued requests and dispatch each batch without waiting for the previous one"""
+        loop = asyncio.get_running_loop()
+        queue = self._sq
+        in_flight = set()
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                
+                # Coalesce whatever else arrives within the flush window
+                deadline = loop.time() + BATCH_FLUSH_INTERVAL
+                while len(batch) < BATCH_MAX_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # Fire and forget: the batch resolves its own futures, so requests queued
+                # meanwhile don't wait a round trip behind it
+                task = asyncio.create_task(self._send_batch(batch))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Fail everything still queued and cancel in-flight batches so no caller waits forever
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._fail_pending(batch)
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            raise
+    
+    async def _submit(self, method: str, endpoint: str, body: dict = None) -> dict:
+        """Queue a request for the batch worker and wait for its response"""
+        if self._sq_worker is None or self._sq_worker.done():
+            self._sq = asyncio.Queue()
+            self._sq_worker = asyncio.create_task(self._submit_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._sq.put((method, endpoint, body, future))
+        return await future
+    
+    async def aclose_http(self):
+        """Close the async resources bound to the running event loop (batch worker, aiohttp session)
+        
+        The sync session and signing pool stay open, so the client remains usable from
+        sync code and from a later event loop.
+        """
+        if self._sq_worker is not None:
+            worker, self._sq_worker = self._sq_worker, None
+            worker.cancel()
+            # Let the worker fail its pending futures before the sessions go away
+            await asyncio.gather(worker, return_exceptions=True)
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+    
+    async def aclose(self):
+        """Close the pooled HTTP sessions (sync and async)"""
+        await self.aclose_http()
+        self.close()
+    
     # ============= Public Market Data Methods =============
     
+    def _cache_lookup(self, key: Optional[str], ttl: float):
+        """Return a copy of the cached response for key if it is younger than ttl seconds, else None"""
+        cached = self._instr_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return copy.deepcopy(cached[1])
+        return None
+    
+    def _cache_store(self, key: Optional[str], ok: bool, val):
+        """Cache val under key if the response succeeded, and return it"""
+        # Error payloads are never cached; the cache keeps its own copy so callers can't alter it
+        if ok:
+            self._instr_cache[key] = (time.monotonic(), copy.deepcopy(val))
+        return val
+    
+    def _cached_get(self, key: Optional[str], ttl: float, url: str):
+        """GET url through the instrument cache"""
+        val = self._cache_lookup(key, ttl)
+        if val is None:
+            response = self._session.get(url)
+            val = self._cache_store(key, response.ok, response.json())
+        return val
+    
     def get_active_instruments(self) -> List[str]:
-        """Get list of active futures instruments"""
+        """Get list of active futures instruments (cached for ACTIVE_INSTRUMENTS_TTL seconds)"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/active_instruments"
-        response = requests.get(url)
-        return response.json()
+        return self._cached_get(None, ACTIVE_INSTRUMENTS_TTL, url)
     
     def get_instrument_details(self, pair: str) -> dict:
-        """Get details for a specific instrument"""
+        """Get details for a specific instrument (cached per pair for INSTRUMENT_DETAILS_TTL seconds)"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/instrument?pair={pair}"
-        response = requests.get(url)
-        return response.json()
+        return self._cached_get(pair, INSTRUMENT_DETAILS_TTL, url)
+    
+    async def aget_instrument_details(self, pair: str) -> dict:
+        """Async version of get_instrument_details (shares its cache)"""
+        val = self._cache_lookup(pair, INSTRUMENT_DETAILS_TTL)
+        if val is None:
+            url = f"{self.base_url}/exchange/v1/derivatives/futures/data/instrument?pair={pair}"
+            async with self._get_http().get(url) as response:
+                # status check rather than response.ok, which needs aiohttp 3.9
+                val = self._cache_store(pair, response.status < 400, await response.json())
+        return val
     
     def get_orderbook(self, pair: str, depth: int = 50) -> dict:
         """
@@ -179,16 +474,22 @@ class CoinDCXFutures:
             depth: Orderbook depth (10, 20, or 50)
         """
         url = f"https://public.coindcx.com/market_data/v3/orderbook/{pair}-futures/{depth}"
-        response = requests.get(url)
+        response = self._session.get(url)
         return response.json()
     
+    async def aget_orderbook(self, pair: str, depth: int = 50) -> dict:
+        """Async version of get_orderbook using the pooled aiohttp session"""
+        url = f"https://public.coindcx.com/market_data/v3/orderbook/{pair}-futures/{depth}"
+        async with self._get_http().get(url) as response:
+            return await response.json()
+    
     def get_trades(self, pair: str) -> List[dict]:
         """Get recent trades for an instrument"""
         url = f"{self.base_url}/exchange/v1/derivatives/futures/data/trades?pair={pair}"
-        response = requests.get(url)
+        response = self._session.get(url)
         return response.json()
     
-    def get_candlesticks(self, pair: str, resolution: str, from_time: int, to_time: int) -> dict:
+    def get_candlesticks(self, pair: str, resolution: str, from_time: int, to_time: int, as_array: bool = False):
         """
         Get candlestick data
         
@@ -197,6 +498,8 @@ class CoinDCXFutures:
             resolution: '1', '5', '60', or '1D' for 1min, 5min, 1hour, 1day
             from_time: Start timestamp (epoch seconds)
             to_time: End timestamp (epoch seconds)
+            as_array: Return the candles as a NumPy structured array with fields
+                time, open, high, low, close, volume (requires numpy)
         """
         url = "https://public.coindcx.com/market_data/candlesticks"
         params = {
@@ -206,11 +509,69 @@ class CoinDCXFutures:
             "resolution": resolution,
             "pcode": "f"
         }
-        response = requests.get(url, params=params)
-        return response.json()
+        response = self._session.get(url, params=params)
+        data = response.json()
+        
+        if not as_array:
+            return data
+        
+        try:
+            import numpy as np
+        except ImportError as e:
+            logger.error(f"numpy is required for as_array=True: {e}")
+            raise ImportError("numpy package is required. Install with: pip install numpy")
+        
+        candles = data.get('data', []) if isinstance(data, dict) else data
+        return np.array(
+            [(c['time'], c['open'], c['high'], c['low'], c['close'], c['volume']) for c in candles],
+            dtype=[('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('volume', 'f8')]
+        )
     
     # ============= Order Management Methods =============
     
+    def _build_order_body(self,
+                          pair: str,
+                          side: Union[str, OrderSide],
+                          order_type: Union[str, OrderType],
+                          quantity: float,
+                          leverage: int = 1,
+                          price: float = None,
+                          time_in_force: Union[str, TimeInForce] = TimeInForce.GOOD_TILL_CANCEL,
+                          hidden: bool = False,
+                          post_only: bool = False,
+                          notification: str = "email_notification",
+                          margin_currency: str = "INR",
+                          position_margin_type: str = "isolated") -> dict:
+        """Build the request body for a new order"""
+        # Convert enums to strings if needed
+        side = _ENUM_VAL.get(side, side)
+        order_type = _ENUM_VAL.get(order_type, order_type)
+        time_in_force = _ENUM_VAL.get(time_in_force, time_in_force)
+        
+        body = {
+            "order": {
+                "pair": pair,
+                "order_type": order_type,
+                "notification": notification,
+                "leverage": leverage,
+                "margin_currency_short_name": margin_currency,
+                "position_margin_type": position_margin_type,
+                "side": side,
+                "stop_loss_price": None,
+                "take_profit_price": None,
+                "time_in_force": time_in_force,
+                "total_quantity": quantity
+            }
+        }
+        
+        # Add price for limit orders
+        if order_type in ["limit_order", "stop_limit", "take_profit_limit"]:
+            if price is None:
+                raise ValueError(f"Price is required for {order_type}")
+            body["order"]["price"] = str(price)
+        
+        return body
+    
     def place_order(self, 
                    pair: str,
                    side: Union[str, OrderSide],
@@ -241,37 +602,87 @@ class CoinDCXFutures:
             margin_currency: Margin currency ("INR" or "USDT")
             position_margin_type: Margin type ("isolated" or "cross")
         """
-        # Convert enums to strings if needed
-        if isinstance(side, OrderSide):
-            side = side.value
-        if isinstance(order_type, OrderType):
-            order_type = order_type.value
-        if isinstance(time_in_force, TimeInForce):
-            time_in_force = time_in_force.value
+        body = self._build_order_body(pair, side, order_type, quantity, leverage, price, time_in_force,
+                                       hidden, post_only, notification, margin_currency, position_margin_type)
+        result = self._make_request('POST', '/exchange/v1/derivatives/futures/orders/create', body)
+        logger.info(f"Order placed: {result}")
+        return result
+    
+    async def aplace_order(self, 
+                          pair: str,
+                          side: Union[str, OrderSide],
+                          order_type: Union[str, OrderType],
+                          quantity: float,
+                          leverage: int = 1,
+                          price: float = None,
+                          time_in_force: Union[str, TimeInForce] = TimeInForce.GOOD_TILL_CANCEL,
+                          hidden: bool = False,
+                          post_only: bool = False,
+                          notification: str = "email_notification",
+                          margin_currency: str = "INR",
+                          position_margin_type: str = "isolated") -> dict:
+        """Async version of place_order using the pooled aiohttp session"""
+        body = self._build_order_body(pair, side, order_type, quantity, leverage, price, time_in_force,
+                                       hidden, post_only, notification, margin_currency, position_margin_type)
+        result = await self._amake_request('POST', '/exchange/v1/derivatives/futures/orders/create', body)
+        logger.info(f"Order placed: {result}")
+        return result
+    
+    def place_orders(self, orders: List[dict]) -> List[Union[dict, Exception]]:
+        """
+        Place several orders back-to-back over the pooled session
         
-        body = {
-            "order": {
-                "pair": pair,
-                "order_type": order_type,
-                "notification": notification,
-                "leverage": leverage,
-                "margin_currency_short_name": margin_currency,
-                "position_margin_type": position_margin_type,
-                "side": side,
-                "stop_loss_price": None,
-                "take_profit_price": None,
-                "time_in_force": time_in_force,
-                "total_quantity": quantity
-            }
-        }
+        Every order body is built and validated before the first one is sent. A failed
+        order does not stop the rest, so check every entry of the result.
         
-        # Add price for limit orders
-        if order_type in ["limit_order", "stop_limit", "take_profit_limit"]:
-            if price is None:
-                raise ValueError(f"Price is required for {order_type}")
-            body["order"]["price"] = str(price)
+        Args:
+            orders: List of keyword-argument dicts accepted by place_order
         
-        result = self._make_request('POST', '/exchange/v1/derivatives/futures/orders/create', body)
+        Returns:
+            One entry per order, in input order: the API response, or the exception
+            raised for that order (which was then not placed)
+        """
+        bodies = [self._build_order_body(**params) for params in orders]
+        results = []
+        for body in bodies:
+            try:
+                result = self._make_request('POST', '/exchange/v1/derivatives/futures/orders/create', body)
+            except Exception as e:
+                logger.error(f"Order failed: {e}")
+                result = e
+            else:
+                logger.info(f"Order placed: {result}")
+            results.append(result)
+        return results
+    
+    async def aplace_orders(self, orders: List[dict]) -> List[Union[dict, Exception]]:
+        """Place several orders concurrently; same arguments and per-order results as place_orders"""
+        bodies = [self._build_order_body(**params) for params in orders]
+        results = await asyncio.gather(
+            *(self._amake_request('POST', '/exchange/v1/derivatives/futures/orders/create', body) for body in bodies),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Order failed: {result}")
+            else:
+                logger.info(f"Order placed: {result}")
+        return results
+    
+    async def place_order_batched(self,
+                                  pair: str,
+                                  side: Union[str, OrderSide],
+                                  order_type: Union[str, OrderType],
+                                  quantity: float,
+                                  **kwargs) -> dict:
+        """
+        Place a new order through the batched submission queue
+        
+        Orders queued within the same flush window are sent concurrently.
+        Accepts the same arguments as place_order.
+        """
+        body = self._build_order_body(pair, side, order_type, quantity, **kwargs)
+        result = await self._submit('POST', '/exchange/v1/derivatives/futures/orders/create', body)
         logger.info(f"Order placed: {result}")
         return result
     
@@ -282,6 +693,20 @@ class CoinDCXFutures:
         logger.info(f"Order cancelled: {order_id}")
         return result
     
+    async def acancel_order(self, order_id: str) -> dict:
+        """Async version of cancel_order using the pooled aiohttp session"""
+        body = {"id": order_id}
+        result = await self._amake_request('POST', '/exchange/v1/derivatives/futures/orders/cancel', body)
+        logger.info(f"Order cancelled: {order_id}")
+        return result
+    
+    async def cancel_order_batched(self, order_id: str) -> dict:
+        """Cancel a specific order through the batched submission queue"""
+        body = {"id": order_id}
+        result = await self._submit('POST', '/exchange/v1/derivatives/futures/orders/cancel', body)
+        logger.info(f"Order cancelled: {order_id}")
+        return result
+    
     def cancel_all_orders(self) -> dict:
         """Cancel all open orders"""
         result = self._make_request('POST', '/exchange/v1/derivatives/futures/positions/cancel_all_open_orders')
@@ -316,6 +741,19 @@ class CoinDCXFutures:
         
         return self._make_request('POST', '/exchange/v1/derivatives/futures/orders', body)
     
+    async def aget_orders(self, status: str = "open", side: str = None, page: int = 1, size: int = 10) -> List[dict]:
+        """Async version of get_orders using the pooled aiohttp session"""
+        body = {
+            "status": status,
+            "page": str(page),
+            "size": str(size)
+        }
+        
+        if side:
+            body["side"] = side
+        
+        return await self._amake_request('POST', '/exchange/v1/derivatives/futures/orders', body)
+    
     # ============= Position Management Methods =============
     
     def get_positions(self, page: int = 1, size: int = 10) -> List[Position]:
@@ -326,11 +764,24 @@ class CoinDCXFutures:
         }
         
         result = self._make_request('POST', '/exchange/v1/derivatives/futures/positions', body)
+        return self._parse_positions(result)
+    
+    async def aget_positions(self, page: int = 1, size: int = 10) -> List[Position]:
+        """Async version of get_positions using the pooled aiohttp session"""
+        body = {
+            "page": str(page),
+            "size": str(size)
+        }
         
-        # Convert to Position objects
-        positions = []
-        for pos_data in result:
-            positions.append(Position(
+        result = await self._amake_request('POST', '/exchange/v1/derivatives/futures/positions', body)
+        return self._parse_positions(result)
+    
+    @staticmethod
+    def _parse_positions(result: List[dict]) -> List[Position]:
+        """Convert a positions response to Position objects"""
+        # Convert to Position objects in a single pass
+        return [
+            Position(
                 id=pos_data['id'],
                 pair=pos_data['pair'],
                 active_pos=pos_data['active_pos'],
@@ -339,9 +790,9 @@ class CoinDCXFutures:
                 locked_margin=pos_data['locked_margin'],
                 take_profit_trigger=pos_data.get('take_profit_trigger', 0.0),
                 stop_loss_trigger=pos_data.get('stop_loss_trigger', 0.0)
-            ))
-        
-        return positions
+            )
+            for pos_data in result
+        ]
     
     def exit_position(self, position_id: str) -> dict:
         """Exit/Close a position"""
@@ -477,6 +928,8 @@ class CoinDCXFutures:
                 logger=False,
                 engineio_logger=False
             )
+            for event, callback in self._handlers.items():
+                self.sio.on(event, callback)
         
         if not self.ws_connected:
             try:
@@ -512,14 +965,7 @@ class CoinDCXFutures:
     
     async def _subscribe_authenticated_channel(self):
         """Subscribe to authenticated coindcx channel"""
-        body = {"channel": "coindcx"}
-        signature = self._generate_signature(body)
-        
-        await self.sio.emit('join', {
-            'channelName': 'coindcx',
-            'authSignature': signature,
-            'apiKey': self.api_key
-        })
+        await self.sio.emit('join', self._authchan_payload)
         
         self.subscriptions.add('coindcx')
         logger.info("Subscribed to authenticated channel")
@@ -558,6 +1004,19 @@ class CoinDCXFutures:
         self.subscriptions.add(channel)
         logger.info(f"Subscribed to candlesticks: {channel}")
     
+    async def subscribe_many(self, pairs: List[str], depth: int = 50):
+        """
+        Subscribe to orderbook and trade updates for several pairs concurrently
+        
+        Args:
+            pairs: Instrument pairs
+            depth: Orderbook depth for every pair
+        """
+        async with asyncio.TaskGroup() as tg:
+            for pair in pairs:
+                tg.create_task(self.subscribe_orderbook(pair, depth))
+                tg.create_task(self.subscribe_trades(pair))
+    
     async def unsubscribe(self, channel: str):
         """Unsubscribe from a channel"""
         await self.sio.emit('leave', {'channelName': channel})
@@ -573,51 +1032,36 @@ class CoinDCXFutures:
     
     # ============= WebSocket Event Handlers =============
     
+    def _register_handler(self, event: str, callback: Callable):
+        """Store callback for event and attach it directly to the socket.io client"""
+        self._handlers[event] = callback
+        if self.sio:
+            self.sio.on(event, callback)
+    
     def on_position_update(self, callback):
         """Register callback for position updates"""
-        if self.sio:
-            @self.sio.on('df-position-update')
-            async def handle_position_update(data):
-                await callback(data)
+        self._register_handler('df-position-update', callback)
     
     def on_order_update(self, callback):
         """Register callback for order updates"""
-        if self.sio:
-            @self.sio.on('df-order-update')
-            async def handle_order_update(data):
-                await callback(data)
+        self._register_handler('df-order-update', callback)
     
     def on_balance_update(self, callback):
         """Register callback for balance updates"""
-        if self.sio:
-            @self.sio.on('balance-update')
-            async def handle_balance_update(data):
-                await callback(data)
+        self._register_handler('balance-update', callback)
     
     def on_price_change(self, callback):
         """Register callback for price changes"""
-        if self.sio:
-            @self.sio.on('price-change')
-            async def handle_price_change(data):
-                await callback(data)
+        self._register_handler('price-change', callback)
     
     def on_new_trade(self, callback):
         """Register callback for new trades"""
-        if self.sio:
-            @self.sio.on('new-trade')
-            async def handle_new_trade(data):
-                await callback(data)
+        self._register_handler('new-trade', callback)
     
     def on_depth_update(self, callback):
         """Register callback for orderbook depth updates"""
-        if self.sio:
-            @self.sio.on('depth-update')
-            async def handle_depth_update(data):
-                await callback(data)
+        self._register_handler('depth-update', callback)
     
     def on_candlestick(self, callback):
         """Register callback for candlestick updates"""
-        if self.sio:
-            @self.sio.on('candlestick')
-            async def handle_candlestick(data):
-                await callback(data)
\ No newline at end of file
+        self._register_handler('candlestick', callback)
\ No newline at end of file
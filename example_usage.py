@@ -4,8 +4,63 @@ Shows basic operations like getting market data, placing orders, managing positi
 """
 
 from coindcx_futures import CoinDCXFutures, OrderSide, OrderType, TimeInForce
+import socketio
 import asyncio
-from datetime import datetime
+import random
+import sys
+from collections import defaultdict
+from operator import itemgetter
+from time import localtime, strftime, time as _time
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Enum member -> display name, looked up once instead of via Enum.name per order
+_SIDE_NAME = {m: m.name for m in OrderSide}
+_TYPE_NAME = {m: m.name for m in OrderType}
+
+# Orderbook depth for reads that only use the best bid/ask; 10 is the smallest depth the API serves
+_TOB_DEPTH = 10
+
+# Order update fields, unpacked in one C-level call over a defaults-filled row
+_ORDER_FIELDS = ('id', 'pair', 'side', 'status', 'order_type', 'price', 'total_quantity',
+                 'remaining_quantity', 'leverage', 'locked_margin', 'display_message')
+_ORDER_GET = itemgetter(*_ORDER_FIELDS)
+_ORDER_DEFAULTS = {**dict.fromkeys(_ORDER_FIELDS, 'N/A'), 'display_message': None}
+
+# Last formatted second, so bursts of WebSocket messages reuse the same string
+_last_ts = [0, ""]
+
+
+def _now_hms():
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    now = int(_time())
+    if now != _last_ts[0]:
+        _last_ts[0] = now
+        _last_ts[1] = strftime("%H:%M:%S", localtime(now))
+    return _last_ts[1]
+
+
+# Shared client so examples reuse one pooled HTTP session instead of reconnecting per call
+_CLIENT = None
+
+
+def _get_client():
+    """Return the shared CoinDCXFutures client, creating it on first use"""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = CoinDCXFutures()
+    return _CLIENT
+
+
+def _index_by_pair(orders):
+    """Group orders by pair so per-pair lookups are a single dict access"""
+    by_pair = defaultdict(list)
+    for o in orders:
+        by_pair[o['pair']].append(o)
+    return by_pair
 
 
 def example_market_data():
@@ -14,7 +69,7 @@ def example_market_data():
     print("MARKET DATA EXAMPLE")
     print("="*60)
     
-    client = CoinDCXFutures()
+    client = _get_client()
     
     # Get active instruments
     instruments = client.get_active_instruments()
@@ -25,16 +80,20 @@ def example_market_data():
     pair = "B-BTC_USDT"
     orderbook = client.get_orderbook(pair, depth=5)
     
-    if orderbook and 'bids' in orderbook and 'asks' in orderbook:
+    try:
         bids = orderbook['bids']
         asks = orderbook['asks']
-        if bids and asks:
-            best_bid = list(bids.keys())[0]
-            best_ask = list(asks.keys())[0]
-            print(f"\n{pair} Orderbook:")
-            print(f"  Best Bid: ${best_bid}")
-            print(f"  Best Ask: ${best_ask}")
-            print(f"  Spread: ${float(best_ask) - float(best_bid):.2f}")
+    except (KeyError, TypeError):
+        bids = asks = None
+    
+    if bids and asks:
+        # Convert price keys to floats once and reuse them below
+        best_bid = float(next(iter(bids)))
+        best_ask = float(next(iter(asks)))
+        print(f"\n{pair} Orderbook:")
+        print(f"  Best Bid: ${best_bid}")
+        print(f"  Best Ask: ${best_ask}")
+        print(f"  Spread: ${best_ask - best_bid:.2f}")
     
     # Get recent trades
     trades = client.get_trades(pair)
@@ -51,7 +110,7 @@ def example_account_info():
     print("ACCOUNT INFORMATION EXAMPLE")
     print("="*60)
     
-    client = CoinDCXFutures()
+    client = _get_client()
     
     try:
         # Get current positions
@@ -100,7 +159,7 @@ def example_place_order(pair=None, side=None, order_type=None, quantity=None, pr
     print("PLACE ORDER EXAMPLE")
     print("="*60)
     
-    client = CoinDCXFutures()
+    client = _get_client()
     
     try:
         # Set defaults if not provided
@@ -110,70 +169,92 @@ def example_place_order(pair=None, side=None, order_type=None, quantity=None, pr
             side = OrderSide.BUY
         if order_type is None:
             order_type = OrderType.LIMIT_ORDER
+        # Enum members are singletons, so an identity check is enough
+        is_market = order_type is OrderType.MARKET_ORDER
             
-        # Get current market price for reference
-        orderbook = client.get_orderbook(pair, depth=10)
+        # The orderbook is only needed for market orders (reference price) or a default limit price
+        need_book = is_market or price is None
         
-        if orderbook and 'bids' in orderbook and orderbook['bids']:
-            best_bid = float(list(orderbook['bids'].keys())[0])
-            best_ask = float(list(orderbook['asks'].keys())[0]) if 'asks' in orderbook and orderbook['asks'] else best_bid
-            
-            # Set defaults based on order type
-            if quantity is None:
-                quantity = 0.004  # Minimum quantity for BTC
-                
-            # Handle pricing based on order type
-            if order_type == OrderType.MARKET_ORDER:
-                # Market orders don't need price
-                price = None
-                print(f"\nPlacing MARKET order:")
-                print(f"  Current Market Price: ${best_ask:.2f} (ask) / ${best_bid:.2f} (bid)")
-            else:
-                # Limit orders need price
-                if price is None:
-                    # Default to 50% below market for buy, 50% above for sell
-                    if side == OrderSide.BUY:
-                        price = best_bid * 0.5
-                    else:
-                        price = best_ask * 1.5
-                print(f"\nPlacing LIMIT order:")
-                print(f"  Order Price: ${price:.2f}")
-                print(f"  Current Market: ${best_ask:.2f} (ask) / ${best_bid:.2f} (bid)")
+        if need_book:
+            # Get current market price for reference
+            orderbook = client.get_orderbook(pair, depth=_TOB_DEPTH)
             
-            print(f"  Pair: {pair}")
-            print(f"  Side: {side.name}")
-            print(f"  Type: {order_type.name}")
-            print(f"  Quantity: {quantity}")
-            print(f"  Leverage: {leverage}x")
-            print(f"  Collateral: {margin_currency}")
-            print(f"  Margin Type: {position_margin_type}")
-            
-            # Build order parameters
-            order_params = {
-                "pair": pair,
-                "side": side,
-                "order_type": order_type,
-                "quantity": quantity,
-                "leverage": leverage,
-                "time_in_force": time_in_force,
-                "margin_currency": margin_currency,
-                "position_margin_type": position_margin_type
-            }
-            
-            # Only add price for limit orders
-            if order_type != OrderType.MARKET_ORDER and price is not None:
-                order_params["price"] = price
+            try:
+                bids = orderbook['bids']
+            except (KeyError, TypeError):
+                bids = None
+            if not bids:
+                print("Error: Could not fetch market price")
+                return None
             
-            order = client.place_order(**order_params)
+            best_bid = float(next(iter(bids)))
+            asks = orderbook.get('asks')
+            best_ask = float(next(iter(asks))) if asks else best_bid
+        
+        # Set defaults based on order type
+        if quantity is None:
+            quantity = 0.004  # Minimum quantity for BTC
             
-            if order and len(order) > 0:
-                order_id = order[0]['id']
-                print(f"\nOrder placed successfully!")
-                print(f"  Order ID: {order_id}")
-                return order
-            else:
-                print("\nNo order returned")
-                return None
+        # Handle pricing based on order type
+        if is_market:
+            # Market orders don't need price
+            price = None
+            lines = [
+                f"\nPlacing MARKET order:",
+                f"  Current Market Price: ${best_ask:.2f} (ask) / ${best_bid:.2f} (bid)"
+            ]
+        else:
+            # Limit orders need price
+            if price is None:
+                # Default to 50% below market for buy, 50% above for sell
+                if side == OrderSide.BUY:
+                    price = best_bid * 0.5
+                else:
+                    price = best_ask * 1.5
+            lines = [
+                f"\nPlacing LIMIT order:",
+                f"  Order Price: ${price:.2f}"
+            ]
+            if need_book:
+                lines.append(f"  Current Market: ${best_ask:.2f} (ask) / ${best_bid:.2f} (bid)")
+        
+        lines += [
+            f"  Pair: {pair}",
+            f"  Side: {_SIDE_NAME[side]}",
+            f"  Type: {_TYPE_NAME[order_type]}",
+            f"  Quantity: {quantity}",
+            f"  Leverage: {leverage}x",
+            f"  Collateral: {margin_currency}",
+            f"  Margin Type: {position_margin_type}"
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        # Build order parameters
+        order_params = {
+            "pair": pair,
+            "side": side,
+            "order_type": order_type,
+            "quantity": quantity,
+            "leverage": leverage,
+            "time_in_force": time_in_force,
+            "margin_currency": margin_currency,
+            "position_margin_type": position_margin_type
+        }
+        
+        # Only add price for limit orders
+        if not is_market and price is not None:
+            order_params["price"] = price
+        
+        order = client.place_order(**order_params)
+        
+        if order and len(order) > 0:
+            order_id = order[0]['id']
+            print(f"\nOrder placed successfully!")
+            print(f"  Order ID: {order_id}")
+            return order
+        else:
+            print("\nNo order returned")
+            return None
             
     except Exception as e:
         print(f"Error placing order: {e}")
@@ -191,7 +272,7 @@ def example_cancel_order(order_id=None, pair=None):
     print("CANCEL ORDER EXAMPLE")
     print("="*60)
     
-    client = CoinDCXFutures()
+    client = _get_client()
     
     try:
         if pair is None:
@@ -207,19 +288,19 @@ def example_cancel_order(order_id=None, pair=None):
                 return None
                 
             # Filter for the specified pair if there are orders
-            pair_orders = [o for o in open_orders if o.pair == pair]
+            pair_orders = _index_by_pair(open_orders)[pair]
             
             if pair_orders:
                 order_to_cancel = pair_orders[0]  # Most recent order for this pair
             else:
                 order_to_cancel = open_orders[0]  # Most recent order overall
                 
-            order_id = order_to_cancel.id
+            order_id = order_to_cancel['id']
             print(f"Found open order: {order_id}")
-            print(f"  Pair: {order_to_cancel.pair}")
-            print(f"  Side: {order_to_cancel.side}")
-            print(f"  Price: {order_to_cancel.price}")
-            print(f"  Quantity: {order_to_cancel.total_quantity}")
+            print(f"  Pair: {order_to_cancel.get('pair')}")
+            print(f"  Side: {order_to_cancel.get('side')}")
+            print(f"  Price: {order_to_cancel.get('price')}")
+            print(f"  Quantity: {order_to_cancel.get('total_quantity')}")
         
         print(f"\nCancelling order: {order_id}")
         
@@ -249,7 +330,7 @@ def example_cancel_all_orders(pair=None):
     print("CANCEL ALL ORDERS EXAMPLE")
     print("="*60)
     
-    client = CoinDCXFutures()
+    client = _get_client()
     
     try:
         # Get all open orders
@@ -261,28 +342,93 @@ def example_cancel_all_orders(pair=None):
             
         # Filter by pair if specified
         if pair:
-            orders_to_cancel = [o for o in open_orders if o.pair == pair]
+            orders_to_cancel = _index_by_pair(open_orders)[pair]
             print(f"Found {len(orders_to_cancel)} open orders for {pair}")
         else:
             orders_to_cancel = open_orders
             print(f"Found {len(orders_to_cancel)} open orders total")
         
         cancelled_orders = []
+        cancel = client.cancel_order  # bound once, not looked up per order
         
-        # Cancel each order
+        results = []
+        
+        # Cancel each order; output is deferred so terminal I/O stays off the cancel path
         for order in orders_to_cancel:
-            print(f"\nCancelling order {order.id[:8]}...")
-            print(f"  Pair: {order.pair}, Side: {order.side}, Price: {order.price}")
-            
             try:
-                result = client.cancel_order(order.id)
-                if result:
-                    cancelled_orders.append(order.id)
-                    print(f"  ✓ Cancelled successfully")
-                else:
-                    print(f"  ✗ Failed to cancel")
+                ok = bool(cancel(order['id']))
+                results.append((order, ok, None))
             except Exception as e:
-                print(f"  ✗ Error: {e}")
+                results.append((order, False, e))
+        
+        lines = []
+        for order, ok, err in results:
+            lines.append(f"\nCancelling order {order['id'][:8]}...")
+            lines.append(f"  Pair: {order.get('pair')}, Side: {order.get('side')}, Price: {order.get('price')}")
+            if err is not None:
+                lines.append(f"  ✗ Error: {err}")
+            elif ok:
+                cancelled_orders.append(order['id'])
+                lines.append(f"  ✓ Cancelled successfully")
+            else:
+                lines.append(f"  ✗ Failed to cancel")
+        lines.append(f"\n{len(cancelled_orders)} orders cancelled successfully")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return cancelled_orders
+        
+    except Exception as e:
+        print(f"Error cancelling orders: {e}")
+        return []
+
+
+async def example_cancel_all_orders_async(pair=None):
+    """Example: Cancel all open orders concurrently
+    
+    Args:
+        pair: Trading pair to cancel orders for (if None, cancels all)
+    """
+    print("\n" + "="*60)
+    print("CANCEL ALL ORDERS (ASYNC) EXAMPLE")
+    print("="*60)
+    
+    client = _get_client()
+    
+    # Cap in-flight cancels to stay within the exchange rate limit
+    sem = asyncio.Semaphore(10)
+    
+    async def cancel(order_id):
+        async with sem:
+            return await client.acancel_order(order_id)
+    
+    try:
+        # Get all open orders
+        open_orders = await client.aget_orders(status="open")
+        
+        if not open_orders:
+            print("No open orders to cancel")
+            return []
+            
+        # Filter by pair if specified
+        if pair:
+            orders_to_cancel = _index_by_pair(open_orders)[pair]
+            print(f"Found {len(orders_to_cancel)} open orders for {pair}")
+        else:
+            orders_to_cancel = open_orders
+            print(f"Found {len(orders_to_cancel)} open orders total")
+        
+        # Send all cancels at once instead of one round-trip per order
+        tasks = [asyncio.create_task(cancel(o['id'])) for o in orders_to_cancel]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        cancelled_orders = []
+        for order, result in zip(orders_to_cancel, results):
+            if isinstance(result, Exception):
+                print(f"  ✗ {order['id'][:8]}... Error: {result}")
+            elif result:
+                cancelled_orders.append(order['id'])
+                print(f"  ✓ {order['id'][:8]}... cancelled")
+            else:
+                print(f"  ✗ {order['id'][:8]}... failed to cancel")
         
         print(f"\n{len(cancelled_orders)} orders cancelled successfully")
         return cancelled_orders
@@ -290,6 +436,10 @@ def example_cancel_all_orders(pair=None):
     except Exception as e:
         print(f"Error cancelling orders: {e}")
         return []
+    
+    finally:
+        # The aiohttp session is tied to this event loop; the shared client itself stays open
+        await client.aclose_http()
 
 
 async def example_websocket():
@@ -298,87 +448,113 @@ async def example_websocket():
     print("WEBSOCKET ORDER & ACCOUNT UPDATES (24/7)")
     print("="*60)
     
-    client = CoinDCXFutures()
-    reconnect_delay = 5  # Start with 5 seconds
+    client = _get_client()
+    initial_reconnect_delay = 0.2  # Fast first retry for transient network blips
+    slow_reconnect_delay = 5  # Floor for non-transport errors (e.g. rejected auth)
     max_reconnect_delay = 60  # Max 60 seconds between reconnects
+    healthy_uptime = 30  # A connection that stays up this long counts as healthy, even if quiet
+    reconnect_delay = initial_reconnect_delay
+    loop = asyncio.get_running_loop()
+    
+    def mark_healthy():
+        # Only a received message proves the link works, so backoff resets here
+        nonlocal reconnect_delay
+        reconnect_delay = initial_reconnect_delay
     
     # Define callbacks outside the loop so they persist
     async def on_order_update(data):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"\n[ORDER UPDATE] {timestamp}")
+        mark_healthy()
+        timestamp = _now_hms()
+        lines = [f"\n[ORDER UPDATE] {timestamp}"]
         
         if isinstance(data, dict) and 'data' in data:
             try:
-                import json
-                orders = json.loads(data['data'])
+                orders = _json_loads(data['data'])
                 for order in orders:
-                    print(f"  Order ID: {order.get('id', 'N/A')[:8]}...")
-                    print(f"  Symbol: {order.get('pair', 'N/A')}")
-                    print(f"  Side: {order.get('side', 'N/A').upper()}")
-                    print(f"  Status: {order.get('status', 'N/A').upper()}")
-                    print(f"  Type: {order.get('order_type', 'N/A')}")
-                    print(f"  Price: ₹{order.get('price', 'N/A')}")
-                    print(f"  Quantity: {order.get('total_quantity', 'N/A')}")
-                    print(f"  Remaining: {order.get('remaining_quantity', 'N/A')}")
-                    print(f"  Leverage: {order.get('leverage', 'N/A')}x")
-                    print(f"  Margin: ₹{order.get('locked_margin', 'N/A')}")
-                    if order.get('display_message'):
-                        print(f"  Message: {order.get('display_message')}")
+                    (order_id, symbol, side, status, order_type, price, quantity,
+                     remaining, leverage, margin, message) = _ORDER_GET({**_ORDER_DEFAULTS, **order})
+                    lines += [
+                        f"  Order ID: {order_id[:8]}...",
+                        f"  Symbol: {symbol}",
+                        f"  Side: {side.upper()}",
+                        f"  Status: {status.upper()}",
+                        f"  Type: {order_type}",
+                        f"  Price: ₹{price}",
+                        f"  Quantity: {quantity}",
+                        f"  Remaining: {remaining}",
+                        f"  Leverage: {leverage}x",
+                        f"  Margin: ₹{margin}"
+                    ]
+                    if message:
+                        lines.append(f"  Message: {message}")
             except Exception as e:
-                print(f"  Raw data: {data}")
+                lines.append(f"  Raw data: {data}")
         else:
-            print(f"  Raw data: {data}")
+            lines.append(f"  Raw data: {data}")
+        
+        # One write per message instead of one per field
+        sys.stdout.write("\n".join(lines) + "\n")
     
     async def on_balance_update(data):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"\n[BALANCE UPDATE] {timestamp}")
+        mark_healthy()
+        timestamp = _now_hms()
+        lines = [f"\n[BALANCE UPDATE] {timestamp}"]
         
         if isinstance(data, dict) and 'data' in data:
             try:
-                import json
-                balances = json.loads(data['data'])
+                balances = _json_loads(data['data'])
                 for balance in balances:
-                    print(f"  Currency: {balance.get('currency', 'N/A')}")
-                    print(f"  Available: {balance.get('available_balance', 'N/A')}")
-                    print(f"  Locked: {balance.get('locked_balance', 'N/A')}")
+                    lines.append(f"  Currency: {balance.get('currency', 'N/A')}")
+                    lines.append(f"  Available: {balance.get('available_balance', 'N/A')}")
+                    lines.append(f"  Locked: {balance.get('locked_balance', 'N/A')}")
             except:
-                print(f"  Raw data: {data}")
+                lines.append(f"  Raw data: {data}")
         else:
-            print(f"  Raw data: {data}")
+            lines.append(f"  Raw data: {data}")
+        
+        # One write per message instead of one per field
+        sys.stdout.write("\n".join(lines) + "\n")
     
     async def on_position_update(data):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"\n[POSITION UPDATE] {timestamp}")
+        mark_healthy()
+        timestamp = _now_hms()
+        lines = [f"\n[POSITION UPDATE] {timestamp}"]
         
         if isinstance(data, dict) and 'data' in data:
             try:
-                import json
-                positions = json.loads(data['data'])
+                positions = _json_loads(data['data'])
                 for pos in positions:
-                    print(f"  Symbol: {pos.get('pair', 'N/A')}")
-                    print(f"  Active Position: {pos.get('active_pos', 'N/A')}")
-                    print(f"  Inactive Buy: {pos.get('inactive_pos_buy', 'N/A')}")
-                    print(f"  Inactive Sell: {pos.get('inactive_pos_sell', 'N/A')}")
-                    print(f"  Avg Price: {pos.get('avg_price', 'N/A')}")
-                    print(f"  Leverage: {pos.get('leverage', 'N/A')}x")
-                    print(f"  Locked Margin: ₹{pos.get('locked_order_margin', 'N/A')}")
+                    lines.append(f"  Symbol: {pos.get('pair', 'N/A')}")
+                    lines.append(f"  Active Position: {pos.get('active_pos', 'N/A')}")
+                    lines.append(f"  Inactive Buy: {pos.get('inactive_pos_buy', 'N/A')}")
+                    lines.append(f"  Inactive Sell: {pos.get('inactive_pos_sell', 'N/A')}")
+                    lines.append(f"  Avg Price: {pos.get('avg_price', 'N/A')}")
+                    lines.append(f"  Leverage: {pos.get('leverage', 'N/A')}x")
+                    lines.append(f"  Locked Margin: ₹{pos.get('locked_order_margin', 'N/A')}")
             except:
-                print(f"  Raw data: {data}")
+                lines.append(f"  Raw data: {data}")
         else:
-            print(f"  Raw data: {data}")
+            lines.append(f"  Raw data: {data}")
+        
+        # One write per message instead of one per field
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Set by the socket.io disconnect handler so the loop wakes immediately on a drop
+    disconnect_event = asyncio.Event()
+    
+    async def on_disconnect():
+        disconnect_event.set()
     
     # Infinite loop for automatic reconnection
     while True:
         try:
             # Connect to WebSocket
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _now_hms()
             print(f"\n[{timestamp}] Connecting to WebSocket...")
             await client.connect_websocket()
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _now_hms()
             print(f"[{timestamp}] Connected! (Authenticated channel)")
-            
-            # Reset reconnect delay on successful connection
-            reconnect_delay = 5
+            client.sio.on('disconnect', on_disconnect)
             
             # Register callbacks
             client.on_order_update(on_order_update)
@@ -391,33 +567,33 @@ async def example_websocket():
             print("\n[INFO] WebSocket running 24/7 with auto-reconnect")
             print("[TIP] Place, modify, or cancel orders to see real-time updates!")
             
-            # Keep the connection alive forever
-            while True:
-                # Check connection every 30 seconds
-                await asyncio.sleep(30)
-                
-                # Check if still connected
-                if not client.sio or not client.sio.connected:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    print(f"\n[{timestamp}] Connection lost, reconnecting...")
-                    break
-                else:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    print(f"[{timestamp}] Heartbeat: Connection active")
-                    
+            # Block until the socket reports a disconnect (client pings keep the link warm).
+            # Cleared here, not after the wait: our own disconnect_websocket() also fires the handler
+            disconnect_event.clear()
+            connected_at = loop.time()
+            await disconnect_event.wait()
+            if loop.time() - connected_at >= healthy_uptime:
+                mark_healthy()
+            timestamp = _now_hms()
+            print(f"\n[{timestamp}] Connection lost, reconnecting...")
+            
+        except (ConnectionError, asyncio.TimeoutError, socketio.exceptions.ConnectionError) as e:
+            print(f"\n[ERROR] WebSocket connection error: {e}")
         except Exception as e:
             print(f"\n[ERROR] WebSocket error: {e}")
-            print(f"[INFO] Reconnecting in {reconnect_delay} seconds...")
-            
-            # Try to disconnect cleanly
-            try:
-                await client.disconnect_websocket()
-            except:
-                pass
-            
-            # Wait before reconnecting with exponential backoff
-            await asyncio.sleep(reconnect_delay)
-            reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+            reconnect_delay = max(reconnect_delay, slow_reconnect_delay)
+        
+        # Try to disconnect cleanly (also resets client state so the next connect re-authenticates)
+        try:
+            await client.disconnect_websocket()
+        except:
+            pass
+        
+        # Wait before reconnecting with jittered exponential backoff
+        delay = min(reconnect_delay * (0.5 + random.random()), max_reconnect_delay)
+        print(f"[INFO] Reconnecting in {delay:.1f} seconds...")
+        await asyncio.sleep(delay)
+        reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
 
 
 def main():
@@ -459,6 +635,7 @@ def main():
     # CANCEL ALL ORDERS EXAMPLE
     # example_cancel_all_orders()  # Cancel all open orders
     # example_cancel_all_orders(pair="B-BTC_USDT")  # Cancel all BTC orders
+    # asyncio.run(example_cancel_all_orders_async())  # Cancel all open orders concurrently
     
     # # Example 4: WebSocket
     # print("\n[Skipping WebSocket example - run separately with asyncio.run()]")
@@ -4,34 +4,125 @@ Uses INR wallet balance as collateral
 """
 
 from coindcx_futures import CoinDCXFutures, OrderSide, OrderType, TimeInForce
+import asyncio
+import os
+import threading
 import time
 import sys
 
+# Latest (bid, ask, monotonic ts) per pair, kept fresh by refresh_prices() while an order is being set up
+price_cache = {}
 
-def get_current_price(client, pair):
-    """Get current market price for a pair"""
-    orderbook = client.get_orderbook(pair, depth=1)
-    if orderbook and 'bids' in orderbook and 'asks' in orderbook:
-        best_bid = float(list(orderbook['bids'].keys())[0])
-        best_ask = float(list(orderbook['asks'].keys())[0])
-        mid_price = (best_bid + best_ask) / 2
-        return {
-            'bid': best_bid,
-            'ask': best_ask,
-            'mid': mid_price,
-            'spread': best_ask - best_bid
-        }
-    return None
+# Cached quotes older than this (seconds) are ignored in favour of a REST fetch
+PRICE_MAX_AGE = 1.0
 
+# Only the best bid/ask is read; 10 is the smallest depth the orderbook API serves
+TOB_DEPTH = 10
 
-def place_limit_buy_order(client, pair, percentage_below_market=5, quantity=0.001, leverage=1):
+# How often refresh_prices() polls the orderbook (seconds)
+PRICE_REFRESH_INTERVAL = 0.5
+
+
+# Private reader on a duplicate of stdin's fd, opened on first use. A daemon thread blocked
+# in sys.stdin holds its lock and makes interpreter shutdown abort
+_stdin = None
+
+
+def _read_line(prompt):
+    """input() equivalent that reads through _stdin"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = _stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+async def ainput(prompt=""):
+    """Read a line from stdin without blocking the event loop
+    
+    The read runs on a daemon thread, not the default executor: asyncio.run joins that
+    executor on shutdown, so Ctrl-C at a prompt would hang until a line was entered.
+    """
+    global _stdin
+    if _stdin is None:
+        _stdin = os.fdopen(os.dup(sys.stdin.fileno()), 'r')
+    
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(line, error):
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(line)
+    
+    def read():
+        line, error = None, None
+        try:
+            line = _read_line(prompt)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(resolve, line, error)
+        except RuntimeError:
+            pass  # Event loop already closed (e.g. after Ctrl-C)
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+def _top_of_book(orderbook):
+    """Return (best_bid, best_ask) from an orderbook response, or None"""
+    try:
+        bids = orderbook['bids']
+        asks = orderbook['asks']
+    except (KeyError, TypeError):
+        return None
+    if not bids or not asks:
+        return None
+    return float(next(iter(bids))), float(next(iter(asks)))
+
+
+async def refresh_prices(client, pair, interval=PRICE_REFRESH_INTERVAL):
+    """Keep price_cache[pair] updated with the latest top of book in the background"""
+    while True:
+        try:
+            top = _top_of_book(await client.aget_orderbook(pair, depth=TOB_DEPTH))
+            if top:
+                price_cache[pair] = (*top, time.monotonic())
+        except Exception:
+            # Drop the stale entry so get_current_price falls back to REST
+            price_cache.pop(pair, None)
+        await asyncio.sleep(interval)
+
+
+async def get_current_price(client, pair):
+    """Get current market price for a pair (from the background cache when fresh)"""
+    best_bid, best_ask, ts = price_cache.get(pair, (None, None, float('-inf')))
+    if time.monotonic() - ts >= PRICE_MAX_AGE:
+        top = _top_of_book(await client.aget_orderbook(pair, depth=TOB_DEPTH))
+        if not top:
+            return None
+        best_bid, best_ask = top
+    mid_price = (best_bid + best_ask) / 2
+    return {
+        'bid': best_bid,
+        'ask': best_ask,
+        'mid': mid_price,
+        'spread': best_ask - best_bid
+    }
+
+
+async def place_limit_buy_order(client, pair, percentage_below_market=5, quantity=0.001, leverage=1):
     """Place a limit buy order below market price"""
     print("\n" + "="*60)
     print("PLACING LIMIT BUY ORDER")
     print("="*60)
     
     # Get current market price
-    price_info = get_current_price(client, pair)
+    price_info = await get_current_price(client, pair)
     if not price_info:
         print("Error: Could not fetch market price")
         return None
@@ -56,7 +147,7 @@ def place_limit_buy_order(client, pair, percentage_below_market=5, quantity=0.00
     print(f"  Time in Force: GOOD_TILL_CANCEL")
     
     # Confirm before placing
-    confirm = input("\nPlace this order? (yes/no): ").lower()
+    confirm = (await ainput("\nPlace this order? (yes/no): ")).lower()
     if confirm != 'yes':
         print("Order cancelled by user")
         return None
@@ -64,7 +155,7 @@ def place_limit_buy_order(client, pair, percentage_below_market=5, quantity=0.00
     try:
         # Place the order
         print("\nPlacing order...")
-        order_response = client.place_order(
+        order_response = await client.aplace_order(
             pair=pair,
             side=OrderSide.BUY,
             order_type=OrderType.LIMIT_ORDER,
@@ -91,14 +182,14 @@ def place_limit_buy_order(client, pair, percentage_below_market=5, quantity=0.00
         return None
 
 
-def place_limit_sell_order(client, pair, percentage_above_market=5, quantity=0.001, leverage=1):
+async def place_limit_sell_order(client, pair, percentage_above_market=5, quantity=0.001, leverage=1):
     """Place a limit sell order above market price"""
     print("\n" + "="*60)
     print("PLACING LIMIT SELL ORDER")
     print("="*60)
     
     # Get current market price
-    price_info = get_current_price(client, pair)
+    price_info = await get_current_price(client, pair)
     if not price_info:
         print("Error: Could not fetch market price")
         return None
@@ -123,7 +214,7 @@ def place_limit_sell_order(client, pair, percentage_above_market=5, quantity=0.0
     print(f"  Time in Force: GOOD_TILL_CANCEL")
     
     # Confirm before placing
-    confirm = input("\nPlace this order? (yes/no): ").lower()
+    confirm = (await ainput("\nPlace this order? (yes/no): ")).lower()
     if confirm != 'yes':
         print("Order cancelled by user")
         return None
@@ -131,7 +222,7 @@ def place_limit_sell_order(client, pair, percentage_above_market=5, quantity=0.0
     try:
         # Place the order
         print("\nPlacing order...")
-        order_response = client.place_order(
+        order_response = await client.aplace_order(
             pair=pair,
             side=OrderSide.SELL,
             order_type=OrderType.LIMIT_ORDER,
@@ -158,12 +249,12 @@ def place_limit_sell_order(client, pair, percentage_above_market=5, quantity=0.0
         return None
 
 
-def check_order_status(client, order_id):
+async def check_order_status(client, order_id):
     """Check the status of an order"""
     print(f"\nChecking status of order {order_id}...")
     
     try:
-        orders = client.get_orders(status="open")
+        orders = await client.aget_orders(status="open")
         for order in orders:
             if order.get('id') == order_id:
                 print(f"Order Status: {order.get('status')}")
@@ -179,12 +270,12 @@ def check_order_status(client, order_id):
         return None
 
 
-def cancel_order(client, order_id):
+async def cancel_order(client, order_id):
     """Cancel an order"""
     print(f"\nCancelling order {order_id}...")
     
     try:
-        result = client.cancel_order(order_id)
+        result = await client.acancel_order(order_id)
         print(f"Cancel result: {result}")
         return True
     except Exception as e:
@@ -192,7 +283,38 @@ def cancel_order(client, order_id):
         return False
 
 
-def main():
+def print_open_orders(orders):
+    """Print a list of open orders"""
+    if orders:
+        print(f"\nFound {len(orders)} open orders:")
+        for order in orders:
+            print(f"\n  Order ID: {order.get('id')}")
+            print(f"    Pair: {order.get('pair')}")
+            print(f"    Side: {order.get('side')}")
+            print(f"    Price: ${order.get('price')}")
+            print(f"    Quantity: {order.get('total_quantity')}")
+            print(f"    Remaining: {order.get('remaining_quantity')}")
+    else:
+        print("No open orders")
+
+
+def print_active_positions(positions):
+    """Print the positions with a non-zero size"""
+    active = [p for p in positions if p.active_pos != 0]
+    
+    if active:
+        print(f"\nActive positions:")
+        for pos in active:
+            print(f"\n  {pos.pair}:")
+            print(f"    Size: {pos.active_pos}")
+            print(f"    Avg Price: ${pos.avg_price}")
+            print(f"    Liquidation: ${pos.liquidation_price}")
+            print(f"    Margin (INR): {pos.locked_margin}")
+    else:
+        print("No active positions")
+
+
+async def main():
     """Main test function for limit orders"""
     print("\n" + "="*60)
     print("COINDCX FUTURES - LIMIT ORDER TEST")
@@ -213,7 +335,7 @@ def main():
     print("4. B-MATIC_USDT (Polygon)")
     print("5. Custom pair")
     
-    choice = input("\nSelect pair (1-5): ")
+    choice = await ainput("\nSelect pair (1-5): ")
     
     pair_map = {
         '1': 'B-BTC_USDT',
@@ -225,116 +347,115 @@ def main():
     if choice in pair_map:
         pair = pair_map[choice]
     elif choice == '5':
-        pair = input("Enter pair (e.g., B-BTC_USDT): ")
+        pair = await ainput("Enter pair (e.g., B-BTC_USDT): ")
     else:
         print("Invalid choice")
         return
     
     print(f"\nSelected pair: {pair}")
     
-    # Get instrument details
-    details = client.get_instrument_details(pair)
-    if details and 'instrument' in details:
-        inst = details['instrument']
-        print(f"\nInstrument Details:")
-        print(f"  Min Trade Size: {inst.get('min_trade_size')}")
-        print(f"  Max Leverage: {inst.get('max_leverage_long')}x")
-        print(f"  Maker Fee: {inst.get('maker_fee')}%")
-        print(f"  Taker Fee: {inst.get('taker_fee')}%")
-    
-    # Main menu
-    while True:
-        print("\n" + "="*60)
-        print("ACTIONS:")
-        print("1. Place LIMIT BUY order (below market)")
-        print("2. Place LIMIT SELL order (above market)")
-        print("3. Check open orders")
-        print("4. Cancel an order")
-        print("5. Check positions")
-        print("6. Exit")
-        
-        action = input("\nSelect action (1-6): ")
+    try:
+        # Get instrument details
+        details = await client.aget_instrument_details(pair)
+        if details and 'instrument' in details:
+            inst = details['instrument']
+            print(f"\nInstrument Details:")
+            print(f"  Min Trade Size: {inst.get('min_trade_size')}")
+            print(f"  Max Leverage: {inst.get('max_leverage_long')}x")
+            print(f"  Maker Fee: {inst.get('maker_fee')}%")
+            print(f"  Taker Fee: {inst.get('taker_fee')}%")
         
-        if action == '1':
-            # Place buy order
-            try:
-                qty = float(input("Enter quantity (default 0.001): ") or "0.001")
-                pct = float(input("Percentage below market (default 5%): ") or "5")
-                lev = int(input("Leverage (1-20, default 1): ") or "1")
-                
-                order_id = place_limit_buy_order(client, pair, pct, qty, lev)
-                if order_id:
-                    print(f"\nOrder ID {order_id} saved for tracking")
+        # Main menu
+        while True:
+            print("\n" + "="*60)
+            print("ACTIONS:")
+            print("1. Place LIMIT BUY order (below market)")
+            print("2. Place LIMIT SELL order (above market)")
+            print("3. Check open orders")
+            print("4. Cancel an order")
+            print("5. Check positions")
+            print("6. Check open orders and positions")
+            print("7. Exit")
+            
+            action = await ainput("\nSelect action (1-7): ")
+            
+            if action == '1':
+                # Place buy order, refreshing prices in the background while the prompts are answered
+                refresher = asyncio.create_task(refresh_prices(client, pair))
+                try:
+                    qty = float(await ainput("Enter quantity (default 0.001): ") or "0.001")
+                    pct = float(await ainput("Percentage below market (default 5%): ") or "5")
+                    lev = int(await ainput("Leverage (1-20, default 1): ") or "1")
+                    
+                    order_id = await place_limit_buy_order(client, pair, pct, qty, lev)
+                    if order_id:
+                        print(f"\nOrder ID {order_id} saved for tracking")
+                        
+                except ValueError:
+                    print("Invalid input")
+                finally:
+                    refresher.cancel()
+                    
+            elif action == '2':
+                # Place sell order, refreshing prices in the background while the prompts are answered
+                refresher = asyncio.create_task(refresh_prices(client, pair))
+                try:
+                    qty = float(await ainput("Enter quantity (default 0.001): ") or "0.001")
+                    pct = float(await ainput("Percentage above market (default 5%): ") or "5")
+                    lev = int(await ainput("Leverage (1-20, default 1): ") or "1")
                     
-            except ValueError:
-                print("Invalid input")
-                
-        elif action == '2':
-            # Place sell order
-            try:
-                qty = float(input("Enter quantity (default 0.001): ") or "0.001")
-                pct = float(input("Percentage above market (default 5%): ") or "5")
-                lev = int(input("Leverage (1-20, default 1): ") or "1")
-                
-                order_id = place_limit_sell_order(client, pair, pct, qty, lev)
+                    order_id = await place_limit_sell_order(client, pair, pct, qty, lev)
+                    if order_id:
+                        print(f"\nOrder ID {order_id} saved for tracking")
+                        
+                except ValueError:
+                    print("Invalid input")
+                finally:
+                    refresher.cancel()
+                    
+            elif action == '3':
+                # Check open orders
+                print("\nFetching open orders...")
+                try:
+                    print_open_orders(await client.aget_orders(status="open"))
+                except Exception as e:
+                    print(f"Error fetching orders: {e}")
+                    
+            elif action == '4':
+                # Cancel order
+                order_id = await ainput("Enter order ID to cancel: ")
                 if order_id:
-                    print(f"\nOrder ID {order_id} saved for tracking")
+                    await cancel_order(client, order_id)
                     
-            except ValueError:
-                print("Invalid input")
-                
-        elif action == '3':
-            # Check open orders
-            print("\nFetching open orders...")
-            try:
-                orders = client.get_orders(status="open")
-                if orders:
-                    print(f"\nFound {len(orders)} open orders:")
-                    for order in orders:
-                        print(f"\n  Order ID: {order.get('id')}")
-                        print(f"    Pair: {order.get('pair')}")
-                        print(f"    Side: {order.get('side')}")
-                        print(f"    Price: ${order.get('price')}")
-                        print(f"    Quantity: {order.get('total_quantity')}")
-                        print(f"    Remaining: {order.get('remaining_quantity')}")
-                else:
-                    print("No open orders")
-            except Exception as e:
-                print(f"Error fetching orders: {e}")
-                
-        elif action == '4':
-            # Cancel order
-            order_id = input("Enter order ID to cancel: ")
-            if order_id:
-                cancel_order(client, order_id)
-                
-        elif action == '5':
-            # Check positions
-            print("\nFetching positions...")
-            try:
-                positions = client.get_positions()
-                active = [p for p in positions if p.active_pos != 0]
-                
-                if active:
-                    print(f"\nActive positions:")
-                    for pos in active:
-                        print(f"\n  {pos.pair}:")
-                        print(f"    Size: {pos.active_pos}")
-                        print(f"    Avg Price: ${pos.avg_price}")
-                        print(f"    Mark Price: ${pos.mark_price}")
-                        print(f"    Liquidation: ${pos.liquidation_price}")
-                        print(f"    Margin (INR): {pos.locked_margin}")
-                        print(f"    PnL: {pos.pnl}")
-                else:
-                    print("No active positions")
-            except Exception as e:
-                print(f"Error fetching positions: {e}")
-                
-        elif action == '6':
-            print("\nExiting...")
-            break
-        else:
-            print("Invalid choice")
+            elif action == '5':
+                # Check positions
+                print("\nFetching positions...")
+                try:
+                    print_active_positions(await client.aget_positions())
+                except Exception as e:
+                    print(f"Error fetching positions: {e}")
+                    
+            elif action == '6':
+                # Fetch orders and positions concurrently (one round trip of wall time)
+                print("\nFetching open orders and positions...")
+                try:
+                    orders, positions = await asyncio.gather(
+                        client.aget_orders(status="open"),
+                        client.aget_positions()
+                    )
+                    print_open_orders(orders)
+                    print_active_positions(positions)
+                except Exception as e:
+                    print(f"Error fetching orders/positions: {e}")
+                    
+            elif action == '7':
+                print("\nExiting...")
+                break
+            else:
+                print("Invalid choice")
+    finally:
+        # Close the sessions however the menu exits (including errors and Ctrl-C)
+        await client.aclose()
     
     print("\n" + "="*60)
     print("TEST COMPLETED")
@@ -342,4 +463,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Tests for the batched async submission queue (place_order_batched / cancel_order_batched)
+"""
+
+import asyncio
+import logging
+import time
+import unittest
+
+from coindcx_futures import CoinDCXFutures
+
+# Simulated network round trip for the stubbed requests (seconds)
+RTT = 0.2
+
+
+class BatchedSubmissionTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        # IsolatedAsyncioTestCase runs the loop in debug mode, whose overhead skews the timings
+        asyncio.get_running_loop().set_debug(False)
+        logging.getLogger("coindcx_futures").setLevel(logging.WARNING)
+        self.client = CoinDCXFutures(api_key="key", secret_key="secret")
+        
+        async def fake_request(method, endpoint, body=None):
+            await asyncio.sleep(RTT)
+            return {"endpoint": endpoint, "body": body}
+        
+        self.client._amake_request = fake_request
+    
+    async def asyncTearDown(self):
+        await self.client.aclose()
+    
+    async def test_no_head_of_line_delay(self):
+        """A request queued while a batch is in flight is not held back behind it"""
+        start = time.monotonic()
+        first = asyncio.create_task(self.client.cancel_order_batched("a"))
+        await asyncio.sleep(RTT / 10)
+        await self.client.cancel_order_batched("b")
+        elapsed = time.monotonic() - start
+        await first
+        
+        # Sent ~RTT/10 after the first, so done after ~1.1 RTT (behind the first batch it would be ~2.1)
+        self.assertLess(elapsed, 1.5 * RTT)
+    
+    async def test_burst_completes_in_one_round_trip(self):
+        start = time.monotonic()
+        results = await asyncio.gather(*(self.client.cancel_order_batched(str(i)) for i in range(100)))
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual([r["body"]["id"] for r in results], [str(i) for i in range(100)])
+        self.assertLess(elapsed, 1.5 * RTT)
+    
+    async def test_aclose_fails_pending_requests(self):
+        in_flight = asyncio.create_task(self.client.cancel_order_batched("a"))
+        await asyncio.sleep(RTT / 10)
+        queued = asyncio.create_task(self.client.cancel_order_batched("b"))
+        await asyncio.sleep(0)
+        
+        await self.client.aclose()
+        results = await asyncio.wait_for(asyncio.gather(in_flight, queued, return_exceptions=True), RTT)
+        
+        for result in results:
+            self.assertIsInstance(result, ConnectionError)
+
+
+if __name__ == "__main__":
+    unittest.main()